@@ -2,12 +2,11 @@ use batrun::error::Result;
 use batrun::execution_strategy::ExecutionStrategy;
 use batrun::settings::Settings;
 use batrun::test_runner::TestRunner;
-use batrun::time::format as format_duration;
+use batrun::time::{TimeInterval, format as format_duration};
 
 use clap::Parser;
 
 use std::path::PathBuf;
-use std::time::Instant;
 
 const DEFAULT_OUT_DIR: &str = "out";
 
@@ -105,8 +104,11 @@ impl From<&Cli> for Settings {
 fn main_impl() -> Result<()> {
     let cli = Cli::parse();
     let mut test_runner = TestRunner::new(Settings::from(&cli))?;
+    if cli.list_tests || !cli.list_targets {
+        test_runner.discover_tests()?;
+    }
 
-    let start = Instant::now();
+    let mut time_interval = TimeInterval::new();
     {
         for test_suite_dir in test_runner.settings().test_suite_dirs.clone() {
             let mut run_tests = true;
@@ -123,7 +125,7 @@ fn main_impl() -> Result<()> {
             }
         }
     }
-    let duration = start.elapsed();
+    let duration = time_interval.stop();
     println!();
     println!("Time elapsed: {}", format_duration(duration));
 
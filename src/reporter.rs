@@ -1,8 +1,11 @@
 use crate::error::Error;
 use crate::test_executor::{ExecutionContext, TestCaseExecInfo};
+use crate::test_suite::config::TestSuiteConfig;
 use crate::test_suite::{TestCase, TestSuite};
 
-pub trait Reporter {
+use std::path::Path;
+
+pub trait Reporter: Sync {
     #[track_caller]
     fn notice(&self, message: &str) {
         self.notice_detailed(message, "");
@@ -31,7 +34,7 @@ pub trait Reporter {
     #[track_caller]
     fn error_from(&self, error: &Error);
 
-    fn report_target_list(&self, test_suite: &TestSuite);
+    fn report_target_list(&self, test_suite_dir: &Path, test_suite_config: &TestSuiteConfig);
     fn report_test_list(&self, test_suite: &TestSuite);
     fn report_test_suite_time(&self);
     fn report_test_suite_execution_summary(
@@ -1,12 +1,16 @@
 use crate::error::Error;
 use crate::reporter::Reporter;
 use crate::test_executor::{ExecutionContext, TestCaseExecInfo};
+use crate::test_suite::config::TestSuiteConfig;
 use crate::test_suite::status::TestCaseStatus;
 use crate::test_suite::visitor::Visitor;
 use crate::test_suite::{TestCase, TestSuite};
 
 use colored::{ColoredString, Colorize};
 
+use std::io::{self, BufWriter, StdoutLock, Write};
+use std::path::Path;
+
 pub(crate) struct HumanFriendlyReporter {
     debug_enabled: bool,
     matrix_summary: bool,
@@ -37,6 +41,15 @@ impl HumanFriendlyReporter {
         };
     }
 
+    /// Print a whole report through a single buffered stdout lock, so that it is written with as few
+    /// write calls as possible instead of one per line
+    fn print_buffered(f: impl FnOnce(&mut BufWriter<StdoutLock>) -> io::Result<()>) {
+        let mut out = BufWriter::new(io::stdout().lock());
+        f(&mut out)
+            .and_then(|_| out.flush())
+            .expect("failed printing to stdout");
+    }
+
     fn print_summary_header(&self, test_suite: &TestSuite) {
         println!();
         println!(
@@ -51,34 +64,44 @@ impl HumanFriendlyReporter {
 }
 
 impl Reporter for HumanFriendlyReporter {
-    fn report_target_list(&self, test_suite: &TestSuite) {
-        println!(
-            "{}",
-            format!(
-                "Targets supported by test suite `{}`",
-                test_suite.path().display()
-            )
-            .bright_white()
-        );
-        for target in &test_suite.config().targets {
-            println!("  {}", target.white());
-        }
-        println!("");
+    fn report_target_list(&self, test_suite_dir: &Path, test_suite_config: &TestSuiteConfig) {
+        Self::print_buffered(|out| {
+            writeln!(
+                out,
+                "{}",
+                format!(
+                    "Targets supported by test suite `{}`",
+                    test_suite_dir.display()
+                )
+                .bright_white()
+            )?;
+            for target in &test_suite_config.targets {
+                writeln!(out, "  {}", target.white())?;
+            }
+            writeln!(out)
+        });
     }
 
     fn report_test_list(&self, test_suite: &TestSuite) {
-        println!(
-            "{}",
-            format!(
-                "Tests defined in test suite `{}`",
-                test_suite.path().display()
-            )
-            .bright_white()
-        );
-        Visitor::new(&test_suite).visit_all_ok(|tc, _| {
-            println!("  {}", tc.id().white());
+        Self::print_buffered(|out| {
+            writeln!(
+                out,
+                "{}",
+                format!(
+                    "Tests defined in test suite `{}`",
+                    test_suite.path().display()
+                )
+                .bright_white()
+            )?;
+            let mut result = Ok(());
+            Visitor::new(&test_suite).visit_all_ok(|tc, _| {
+                if result.is_ok() {
+                    result = writeln!(out, "  {}", tc.id().white());
+                }
+            });
+            result?;
+            writeln!(out)
         });
-        println!("");
     }
 
     fn report_test_suite_time(&self) {}
@@ -136,50 +159,51 @@ impl Reporter for HumanFriendlyReporter {
         self.error_detailed(&message, &details);
     }
 
-    fn report_test_case_execution_started(
+    fn report_test_case_execution_result(
         &self,
         test_case: &TestCase,
         target: &str,
-        _exec_info: &TestCaseExecInfo,
-    ) {
-        print!(
-            "Running test case `{}` for target `{}`",
-            test_case.id(),
-            &target
-        );
-    }
-    fn report_test_case_execution_result(
-        &self,
-        _test_case: &TestCase,
-        _target: &str,
         exec_info: &TestCaseExecInfo,
     ) {
-        println!(
-            " {}",
-            match exec_info
-                .result()
-                .as_ref()
-                .map(|output| &output.test_case_status)
-            {
-                Err(_) => "RUNNER_FAILED".red().to_string(),
-                Ok(TestCaseStatus::Failed) => "FAILED".red().to_string(),
-                Ok(TestCaseStatus::Passed) => "PASSED".green().to_string(),
-                Ok(TestCaseStatus::Skipped(reason)) =>
-                    format!("{} (reason: {:?})", "SKIPPED".dimmed(), reason),
-                Ok(TestCaseStatus::DryRun) => "DRYRUN".dimmed().to_string(),
-                Ok(TestCaseStatus::NotRun) => "NOTRUN".dimmed().to_string(),
-                Ok(TestCaseStatus::Running) => "RUNNING".dimmed().to_string(),
-            }
-        );
+        let test_case_status = exec_info
+            .result()
+            .as_ref()
+            .map(|output| &output.test_case_status);
+        let status = match test_case_status {
+            Err(_) => "RUNNER_FAILED".red(),
+            Ok(TestCaseStatus::Failed) => "FAILED".red(),
+            Ok(TestCaseStatus::Passed) => "PASSED".green(),
+            Ok(TestCaseStatus::Skipped(_)) => "SKIPPED".dimmed(),
+            Ok(TestCaseStatus::DryRun) => "DRYRUN".dimmed(),
+            Ok(TestCaseStatus::NotRun) => "NOTRUN".dimmed(),
+            Ok(TestCaseStatus::Running) => "RUNNING".dimmed(),
+        };
+        // The whole line is printed at once so that it cannot be interleaved with the output of
+        // test cases running concurrently for other targets
+        match test_case_status {
+            Ok(TestCaseStatus::Skipped(reason)) => println!(
+                "Running test case `{}` for target `{}` {} (reason: {:?})",
+                test_case.id(),
+                &target,
+                status,
+                reason
+            ),
+            _ => println!(
+                "Running test case `{}` for target `{}` {}",
+                test_case.id(),
+                &target,
+                status
+            ),
+        }
         match exec_info
             .result()
             .as_ref()
             .map(|output| &output.driver_output)
         {
             Ok(Some(driver_output)) => {
-                let driver_output_str = format!("{driver_output}");
+                let driver_output_str = driver_output.to_string();
                 if !driver_output_str.is_empty() {
-                    self.warning(&format!("{driver_output}"))
+                    self.warning(&driver_output_str)
                 }
             }
             _ => (),
@@ -240,91 +264,113 @@ impl<'a> TestSuiteSummaryPrettyPrinter<'a> {
         column_width
     }
 
-    fn pad(width: usize) {
-        print!("{:width$}", "");
+    fn pad(out: &mut impl Write, width: usize) -> io::Result<()> {
+        write!(out, "{:width$}", "")
     }
 
-    fn print_legend(&mut self) {
-        Self::pad(self.max_row_width + 1);
-        println!(
+    fn print_legend(&self, out: &mut impl Write) -> io::Result<()> {
+        Self::pad(out, self.max_row_width + 1)?;
+        writeln!(
+            out,
             "{}: passed    {}: skipped",
             Self::char_pass(),
             Self::char_skip(),
-        );
-        Self::pad(self.max_row_width + 1);
-        println!(
+        )?;
+        Self::pad(out, self.max_row_width + 1)?;
+        writeln!(
+            out,
             "{}: failed    {}: runner failed",
             Self::char_fail(),
             Self::char_rfail(),
-        );
+        )
     }
 
-    fn print_single_statistic(&self, header: &ColoredString, stat: usize, max_stat_len: usize) {
-        print!("{header}: {stat:>width$}  ", width = max_stat_len)
+    fn print_single_statistic(
+        &self,
+        out: &mut impl Write,
+        header: &ColoredString,
+        stat: usize,
+        max_stat_len: usize,
+    ) -> io::Result<()> {
+        write!(out, "{header}: {stat:>width$}  ", width = max_stat_len)
     }
 
-    fn print_statistics(&self, exec_context: &ExecutionContext) {
+    fn print_statistics(
+        &self,
+        out: &mut impl Write,
+        exec_context: &ExecutionContext,
+    ) -> io::Result<()> {
         let stats = exec_context.get_statistics();
         let max_stat_len = stats.max().to_string().len();
-        self.print_single_statistic(&Self::char_pass(), stats.passed, max_stat_len);
-        self.print_single_statistic(&Self::char_fail(), stats.failed, max_stat_len);
-        self.print_single_statistic(&Self::char_rfail(), stats.runner_failed, max_stat_len);
-        self.print_single_statistic(&Self::char_skip(), stats.skipped, max_stat_len);
-        println!("/ {}", stats.total());
+        self.print_single_statistic(out, &Self::char_pass(), stats.passed, max_stat_len)?;
+        self.print_single_statistic(out, &Self::char_fail(), stats.failed, max_stat_len)?;
+        self.print_single_statistic(out, &Self::char_rfail(), stats.runner_failed, max_stat_len)?;
+        self.print_single_statistic(out, &Self::char_skip(), stats.skipped, max_stat_len)?;
+        writeln!(out, "/ {}", stats.total())
     }
 
-    fn print_target_summary(&self) {
+    fn print_target_summary(&self, out: &mut impl Write) -> io::Result<()> {
         let mut depth = 0;
         for exec_context in self.exec_contexts {
-            Self::pad(self.max_row_width + 1);
+            Self::pad(out, self.max_row_width + 1)?;
             for _ in 0..depth {
-                print!("│ ")
+                write!(out, "│ ")?;
             }
-            print!("┌─ {}", exec_context.target());
+            write!(out, "┌─ {}", exec_context.target())?;
             Self::pad(
+                out,
                 self.max_column_width - exec_context.target().len()
                     + (self.exec_contexts.len() * 2)
                     - (depth * 2),
-            );
-            self.print_statistics(exec_context);
+            )?;
+            self.print_statistics(out, exec_context)?;
             depth += 1
         }
-        Self::pad(self.max_row_width + 1);
+        Self::pad(out, self.max_row_width + 1)?;
         for _ in 0..depth {
-            print!("╵ ");
+            write!(out, "╵ ")?;
         }
-        println!();
+        writeln!(out)
+    }
+
+    fn print_test_case_result(&self, out: &mut impl Write, tc: &TestCase) -> io::Result<()> {
+        write!(out, "{:width$} ", tc.id(), width = self.max_row_width)?;
+        for exec_context in self.exec_contexts {
+            let exec_info = exec_context.exec_info().get(tc).unwrap();
+            let c = match exec_info
+                .result()
+                .as_ref()
+                .map(|output| &output.test_case_status)
+            {
+                Err(_) => Self::char_rfail(),
+                Ok(TestCaseStatus::Failed) => Self::char_fail(),
+                Ok(TestCaseStatus::Passed) => Self::char_pass(),
+                Ok(TestCaseStatus::Skipped(_)) => Self::char_skip(),
+                Ok(TestCaseStatus::DryRun) => Self::char_skip(),
+                _ => panic!("aie"), // TODO
+            };
+            write!(out, "{} ", c)?;
+        }
+        writeln!(out)
     }
 
-    fn print_test_cases_result(&self) {
+    fn print_test_cases_result(&self, out: &mut impl Write) -> io::Result<()> {
+        let mut result = Ok(());
         Visitor::new(self.test_suite).visit_all_ok(|tc, _| {
-            print!("{} ", tc.id());
-            Self::pad(self.max_row_width - tc.id().len());
-            for exec_context in self.exec_contexts {
-                let exec_info = exec_context.exec_info().get(tc).unwrap();
-                let c = match exec_info
-                    .result()
-                    .as_ref()
-                    .map(|output| &output.test_case_status)
-                {
-                    Err(_) => Self::char_rfail().to_string(),
-                    Ok(TestCaseStatus::Failed) => Self::char_fail().to_string(),
-                    Ok(TestCaseStatus::Passed) => Self::char_pass().to_string(),
-                    Ok(TestCaseStatus::Skipped(_)) => Self::char_skip().to_string(),
-                    Ok(TestCaseStatus::DryRun) => Self::char_skip().to_string(),
-                    _ => panic!("aie"), // TODO
-                };
-                print!("{} ", c);
+            if result.is_ok() {
+                result = self.print_test_case_result(out, tc);
             }
-            println!();
         });
+        result
     }
 
-    fn print_matrix_summary(&mut self) {
-        println!();
-        self.print_legend();
-        println!();
-        self.print_target_summary();
-        self.print_test_cases_result();
+    fn print_matrix_summary(&self) {
+        HumanFriendlyReporter::print_buffered(|out| {
+            writeln!(out)?;
+            self.print_legend(out)?;
+            writeln!(out)?;
+            self.print_target_summary(out)?;
+            self.print_test_cases_result(out)
+        });
     }
 }
@@ -7,14 +7,14 @@ use std::collections::HashMap;
 use std::fmt::Display;
 use std::path::{Path, PathBuf};
 
-pub trait DriverOutput: Display {}
+pub trait DriverOutput: Display + Send {}
 
 pub struct RunTestOutput {
     pub test_case_status: TestCaseStatus,
     pub driver_output: Option<Box<dyn DriverOutput>>,
 }
 
-pub trait TestDriver {
+pub trait TestDriver: Sync {
     fn test_file_patterns_default(&self) -> Vec<String>;
 
     /// Walk through all files in the test suite and return a list of test cases found
@@ -43,32 +43,17 @@ pub trait TestDriver {
         }
     }
 
-    fn matches_file_pattern(&self, filename: &Path, test_suite_config: &TestSuiteConfig) -> bool {
-        filename.is_file()
-            && self
-                .test_file_pattern_or_default(&test_suite_config)
-                .iter()
-                .map(AsRef::as_ref)
-                .map(glob::Pattern::new)
-                .any(|pattern| {
-                    pattern
-                        .expect("provided string should be a valid glob pattern")
-                        .matches_path(filename)
-                })
-    }
-
-    fn matches_global_fixture_file(
+    /// Compiles the test file patterns once, so that they are not parsed again for every file
+    fn compile_test_file_patterns(
         &self,
-        filename: &Path,
-        test_suite_dir: &Path,
         test_suite_config: &TestSuiteConfig,
-    ) -> bool {
-        match &test_suite_config.global_fixture {
-            Some(global_fixture_file) => {
-                filename == test_suite_dir.join(Path::new(global_fixture_file))
-            }
-            None => false,
-        }
+    ) -> Vec<glob::Pattern> {
+        self.test_file_pattern_or_default(&test_suite_config)
+            .iter()
+            .map(|pattern| {
+                glob::Pattern::new(pattern).expect("provided string should be a valid glob pattern")
+            })
+            .collect()
     }
 
     /// Returns the list of all test files paths in the test suite.
@@ -79,28 +64,39 @@ pub trait TestDriver {
         test_suite_dir: &Path,
         test_suite_config: &TestSuiteConfig,
     ) -> Vec<PathBuf> {
-        let mut test_files = Vec::new();
-        for entry in walkdir::WalkDir::new(test_suite_dir) {
-            if let Ok(entry) = entry {
-                let path = entry.path();
-                if self.matches_file_pattern(path, test_suite_config) {
-                    if !self.matches_global_fixture_file(path, test_suite_dir, test_suite_config) {
-                        match path.strip_prefix(test_suite_dir) {
-                            Ok(local_path) => test_files.push(local_path.to_path_buf()),
-                            // As we are retrieving only subdirs of the test suite dir, making the
-                            // subdirs absolute paths relative to the parent test suite dir should
-                            // never fail
-                            Err(_) => panic!("This should not happen"),
-                        }
-                    }
-                }
-            }
-        }
+        let global_fixture_path = test_suite_config.global_fixture_path(test_suite_dir);
+        let test_file_patterns = self.compile_test_file_patterns(test_suite_config);
+        let mut test_files = walkdir::WalkDir::new(test_suite_dir)
+            .into_iter()
+            .filter_map(|entry| entry.ok())
+            .filter(is_file_entry)
+            .map(walkdir::DirEntry::into_path)
+            .filter(|path| {
+                test_file_patterns
+                    .iter()
+                    .any(|pattern| pattern.matches_path(path))
+            })
+            .filter(|path| Some(path) != global_fixture_path.as_ref())
+            .map(|path| match path.strip_prefix(test_suite_dir) {
+                Ok(local_path) => local_path.to_path_buf(),
+                // As we are retrieving only subdirs of the test suite dir, making the
+                // subdirs absolute paths relative to the parent test suite dir should
+                // never fail
+                Err(_) => panic!("This should not happen"),
+            })
+            .collect::<Vec<_>>();
         test_files.sort();
         test_files
     }
 }
 
+/// Returns true if the directory entry is a regular file or a symlink to a regular file.
+/// The file type comes from the directory listing, so only symlinks require a stat call.
+fn is_file_entry(entry: &walkdir::DirEntry) -> bool {
+    let file_type = entry.file_type();
+    file_type.is_file() || (file_type.is_symlink() && entry.path().is_file())
+}
+
 mod bash;
 
 use bash::BashTestDriver;
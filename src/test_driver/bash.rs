@@ -5,91 +5,247 @@ use crate::test_suite::status::{SkipReason, TestCaseStatus};
 use crate::test_suite::{TestCase, TestFile, TestSuite, TestSuiteFixture};
 
 use std::collections::HashMap;
-use std::fmt::Display;
+use std::fmt::{Display, Write};
+use std::io::{self, BufRead, BufReader, Write as _};
+use std::num::NonZeroUsize;
 use std::path::{Path, PathBuf};
-use std::process::Command;
-
-pub(crate) struct BashTestDriver;
+use std::process::{Child, ChildStdin, ChildStdout, Command, Stdio};
+use std::sync::{Arc, Mutex};
+
+pub(crate) struct BashTestDriver {
+    /// Path of the bash interpreter, resolved once so that spawning a bash process does not search
+    /// the PATH again each time
+    bash_path: PathBuf,
+    /// Long-lived bash processes not currently running a test case, reused by subsequent test cases
+    idle_coprocesses: Mutex<Vec<BashCoprocess>>,
+}
 
 impl BashTestDriver {
     const SETUP_FN_NAME: &str = "setup";
     const TEARDOWN_FN_NAME: &str = "teardown";
     const TEST_FN_PREFIX: &str = "test_";
+    const RUN_FN_BASH_OPTIONS: &str = "-x -e -u -o pipefail";
+
+    /// Bash script sourcing each file given as argument in its own subshell and listing the
+    /// functions it defines. The output of each file is terminated by a marker line on both
+    /// stdout (followed by the exit status of the subshell) and stderr. The stderr marker is
+    /// preceded by a newline, as the stderr of the sourced file may not end with one.
+    const LIST_FUNCTIONS_SCRIPT: &str = r#"
+for file; do
+    ( source "$file" > /dev/null; compgen -A function )
+    echo '###BATRUN_END' "$?"
+    printf '\n%s\n' '###BATRUN_END' >&2
+done
+"#;
+    const LIST_FUNCTIONS_END_MARKER: &str = "###BATRUN_END";
+    const LIST_FUNCTIONS_STDERR_SEPARATOR: &str = "\n###BATRUN_END\n";
+    /// Printed by a test case command, after the error from bash, when the test case log cannot
+    /// be opened
+    const LOG_FAILED_MARKER: &str = "###BATRUN_LOG_FAILED";
 
     pub(crate) fn new() -> Self {
-        Self
+        Self {
+            bash_path: Self::resolve_bash_path(),
+            idle_coprocesses: Mutex::new(Vec::new()),
+        }
+    }
+
+    /// Look for bash in the PATH, falling back to letting the OS resolve it at each spawn if it
+    /// cannot be found there
+    fn resolve_bash_path() -> PathBuf {
+        std::env::var_os("PATH")
+            .and_then(|paths| {
+                std::env::split_paths(&paths)
+                    .map(|dir| dir.join("bash"))
+                    .find(|path| Self::is_executable(path))
+            })
+            .unwrap_or_else(|| PathBuf::from("bash"))
+    }
+
+    /// Returns true if the path is a file with an execute permission bit set, as the PATH search
+    /// done when spawning a process skips non-executable files
+    #[cfg(unix)]
+    fn is_executable(path: &Path) -> bool {
+        use std::os::unix::fs::PermissionsExt;
+        path.metadata()
+            .is_ok_and(|metadata| metadata.is_file() && metadata.permissions().mode() & 0o111 != 0)
     }
 
-    fn get_functions_in_file(&self, file_path: &Path, fn_regex: &str) -> Result<Vec<String>> {
-        let mut list_functions_command = Command::new("bash");
+    #[cfg(not(unix))]
+    fn is_executable(path: &Path) -> bool {
+        path.is_file()
+    }
+
+    /// Returns the functions defined by each of the given files, in the same order.
+    /// The files are split in as many chunks as there are available cores, each chunk being probed
+    /// concurrently by its own bash process
+    fn get_functions_in_files(&self, file_paths: &[PathBuf]) -> Result<Vec<Vec<String>>> {
+        if file_paths.is_empty() {
+            return Ok(Vec::new());
+        }
+        let max_workers = std::thread::available_parallelism()
+            .map_or(1, NonZeroUsize::get)
+            .min(file_paths.len());
+        if max_workers <= 1 {
+            return self.probe_functions_in_files(file_paths);
+        }
+        self.probe_functions_in_chunks(file_paths, file_paths.len().div_ceil(max_workers))
+    }
+
+    /// Probe the given files by chunks of at most `chunk_size` files, each chunk concurrently
+    fn probe_functions_in_chunks(
+        &self,
+        file_paths: &[PathBuf],
+        chunk_size: usize,
+    ) -> Result<Vec<Vec<String>>> {
+        let functions_per_chunk = std::thread::scope(|scope| {
+            file_paths
+                .chunks(chunk_size)
+                .map(|chunk| scope.spawn(|| self.probe_functions_in_files(chunk)))
+                .collect::<Vec<_>>()
+                .into_iter()
+                // UNWRAP: A panic in a probing thread is a bug and must be propagated
+                .map(|handle| handle.join().unwrap())
+                .collect::<Vec<_>>()
+        });
+
+        let mut functions_per_file = Vec::with_capacity(file_paths.len());
+        for functions in functions_per_chunk {
+            functions_per_file.extend(functions?);
+        }
+        Ok(functions_per_file)
+    }
+
+    /// Returns the functions defined by each of the given files, in the same order.
+    /// All the files are probed by a single bash process to pay the interpreter startup only once
+    fn probe_functions_in_files(&self, file_paths: &[PathBuf]) -> Result<Vec<Vec<String>>> {
+        let mut list_functions_command = Command::new(&self.bash_path);
         let output = list_functions_command
             .arg("-c")
-            .arg(format!(
-                "source '{}'; compgen -A function | grep '{}'",
-                file_path.display(),
-                fn_regex,
-            ))
+            .arg(BashTestDriver::LIST_FUNCTIONS_SCRIPT)
+            .arg("bash")
+            .args(file_paths)
             .output()
             .map_err(|io_err| error::kind::TestDriverIo {
                 filename: PathBuf::from(list_functions_command.get_program()),
                 source: io_err,
             })?;
 
-        if output.status.success() {
-            let stdout = String::from_utf8_lossy(&output.stdout);
-            Ok(stdout.trim().split('\n').map(String::from).collect())
-        } else {
-            if output.stdout.is_empty() && output.stderr.is_empty() {
-                // Error::NoTestFound is handled in test runner when needed
-                // Return only an empty list here
-                return Ok(Vec::new());
-            }
-            Err(Error::from(error::kind::TestFileExec {
-                filename: file_path.to_path_buf(),
-                details: String::from_utf8_lossy(&output.stderr).to_string(),
-            }))
-        }
+        Self::parse_list_functions_output(
+            file_paths,
+            &String::from_utf8_lossy(&output.stdout),
+            &String::from_utf8_lossy(&output.stderr),
+        )
     }
 
-    fn get_named_function_in_file(
-        &self,
-        file_path: &Path,
-        fn_name: &str,
-    ) -> Result<Option<String>> {
-        let fn_regex = format!("^{}$", fn_name);
-        let functions = self.get_functions_in_file(file_path, &fn_regex)?;
-        match functions.len() {
-            0 => Ok(None),
-            1 => Ok(Some(functions[0].clone())),
+    /// Split the output of `LIST_FUNCTIONS_SCRIPT` into the functions defined by each of the given
+    /// files, in the same order
+    fn parse_list_functions_output(
+        file_paths: &[PathBuf],
+        stdout: &str,
+        stderr: &str,
+    ) -> Result<Vec<Vec<String>>> {
+        let mut stdout_lines = stdout.lines();
+        let mut stderr_per_file = stderr.split(BashTestDriver::LIST_FUNCTIONS_STDERR_SEPARATOR);
+
+        file_paths
+            .iter()
+            .map(|file_path| {
+                let mut functions = Vec::new();
+                let status = loop {
+                    match stdout_lines.next() {
+                        Some(line) => {
+                            match line.strip_prefix(BashTestDriver::LIST_FUNCTIONS_END_MARKER) {
+                                Some(status) => break Some(status.trim()),
+                                None => functions.push(line.to_string()),
+                            }
+                        }
+                        None => break None,
+                    }
+                };
+                let details = stderr_per_file.next().unwrap_or_default().to_string();
+
+                match status {
+                    Some("0") => Ok(functions),
+                    // compgen fails when no function is defined
+                    // Error::NoTestFound is handled in test runner when needed
+                    // Return only an empty list here
+                    Some(_) if functions.is_empty() && details.is_empty() => Ok(Vec::new()),
+                    _ => Err(Error::from(error::kind::TestFileExec {
+                        filename: file_path.to_path_buf(),
+                        details,
+                    })),
+                }
+            })
+            .collect()
+    }
+
+    fn find_named_function(functions: &[String], fn_name: &str) -> Result<Option<String>> {
+        let mut matching_functions = functions.iter().filter(|function| *function == fn_name);
+        match (matching_functions.next(), matching_functions.next()) {
+            (None, _) => Ok(None),
+            (Some(function), None) => Ok(Some(function.clone())),
             // Function duplication cannot happen in bash as subsequent function
             // definitions override previous ones, but we handle the case anyway
             _ => Err(Error::DuplicatedTestFn(fn_name.to_string())),
         }
     }
 
+    fn find_test_functions(functions: &[String]) -> impl Iterator<Item = &String> {
+        functions
+            .iter()
+            .filter(|function| function.starts_with(BashTestDriver::TEST_FN_PREFIX))
+    }
+
     fn get_test_suite_fixture(
-        &self,
-        test_suite_dir: &Path,
-        test_suite_config: &TestSuiteConfig,
+        local_fixture_path: &Path,
+        functions: &[String],
     ) -> Result<TestSuiteFixture> {
-        test_suite_config
-            .global_fixture
-            .as_ref()
-            .map(PathBuf::from)
-            .map_or(Ok(TestSuiteFixture::default()), |local_fixture_path| {
-                let fixture_path = test_suite_dir.join(&local_fixture_path);
-                Ok(TestSuiteFixture {
-                    setup_test_case: self
-                        .get_named_function_in_file(&fixture_path, BashTestDriver::SETUP_FN_NAME)?
-                        .map(|setup_fn| TestCase::new(&local_fixture_path, &setup_fn)),
-                    teardown_test_case: self
-                        .get_named_function_in_file(
-                            &fixture_path,
-                            BashTestDriver::TEARDOWN_FN_NAME,
-                        )?
-                        .map(|teardown_fn| TestCase::new(&local_fixture_path, &teardown_fn)),
+        let local_fixture_path: Arc<Path> = Arc::from(local_fixture_path);
+        Ok(TestSuiteFixture {
+            setup_test_case: Self::find_named_function(functions, BashTestDriver::SETUP_FN_NAME)?
+                .map(|setup_fn| TestCase::new(local_fixture_path.clone(), &setup_fn)),
+            teardown_test_case: Self::find_named_function(
+                functions,
+                BashTestDriver::TEARDOWN_FN_NAME,
+            )?
+            .map(|teardown_fn| TestCase::new(local_fixture_path.clone(), &teardown_fn)),
+        })
+    }
+
+    fn get_test_file(test_file_local_path: &Path, functions: &[String]) -> Result<TestFile> {
+        let test_file_local_path: Arc<Path> = Arc::from(test_file_local_path);
+        Ok(TestFile {
+            setup_test_case: Self::find_named_function(functions, BashTestDriver::SETUP_FN_NAME)?
+                .map(|setup_fn| TestCase::new(test_file_local_path.clone(), &setup_fn)),
+            teardown_test_case: Self::find_named_function(
+                functions,
+                BashTestDriver::TEARDOWN_FN_NAME,
+            )?
+            .map(|teardown_fn| TestCase::new(test_file_local_path.clone(), &teardown_fn)),
+            test_cases: Self::find_test_functions(functions)
+                .map(|test_fn| TestCase::new(test_file_local_path.clone(), test_fn))
+                .collect(),
+        })
+    }
+
+    fn checkout_coprocess(&self) -> Result<BashCoprocess> {
+        // UNWRAP: The lock is only held to push or pop a coprocess, which cannot panic
+        let idle_coprocess = self.idle_coprocesses.lock().unwrap().pop();
+        match idle_coprocess {
+            Some(coprocess) => Ok(coprocess),
+            None => BashCoprocess::spawn(&self.bash_path).map_err(|io_err| {
+                Error::from(error::kind::TestDriverIo {
+                    filename: self.bash_path.clone(),
+                    source: io_err,
                 })
-            })
+            }),
+        }
+    }
+
+    fn return_coprocess(&self, coprocess: BashCoprocess) {
+        // UNWRAP: The lock is only held to push or pop a coprocess, which cannot panic
+        self.idle_coprocesses.lock().unwrap().push(coprocess);
     }
 
     fn run_test_function_from_file(
@@ -104,35 +260,55 @@ impl BashTestDriver {
     ) -> Result<(TestCaseStatus, TestCaseOutput)> {
         let run_fn_command = RunFnCommandBuilder::new()
             .source_fixture_if_necessary(
-                test_suite_config.global_fixture.clone(),
+                test_suite_config.global_fixture_path(test_suite_dir),
                 file_path,
-                test_suite_dir,
             )
             .source_test_file(&file_path)
             .execute_fn(fn_name, target, out_dir)
             .build();
 
-        let mut bash_command = Command::new("bash");
-        bash_command
-            .args(["-x", "-e", "-u", "-o", "pipefail"])
-            .arg("-c")
-            .arg(&format!(
-                "{{ {run_fn_command} }} &> \"{log_file}\"; {{ env | grep -E '^BATRUN_' || true; }} > \"{envout_file}\";",
-                log_file = log_files.test_case.display(),
-                // debug_file = log_files.debug.display(),
-                envout_file = log_files.envout.display()
-            ));
-
-        let output = bash_command
-            .output()
-            .map_err(|io_err| error::kind::TestDriverIo {
-                filename: PathBuf::from(bash_command.get_program()),
-                source: io_err,
-            })?;
+        // The output env vars are written to the captured stdout, kept on fd 3, instead of going
+        // through a file written by bash and read back right after. Everything else, including the
+        // output of an EXIT trap set by the test, goes to the test case log. The error preventing
+        // the log from being opened, if any, is written to the captured stdout.
+        let command = format!(
+            "exec 3>&1 2>&1; exec &> {log_file} || {{ echo '{log_failed}'; exit 1; }}; set {options}; {{ {run_fn_command} }} 3>&-; {{ set +x; }} 2> /dev/null; env | grep -E '^BATRUN_' >&3 || true;",
+            options = BashTestDriver::RUN_FN_BASH_OPTIONS,
+            log_file = quote(&log_files.test_case.to_string_lossy()),
+            log_failed = BashTestDriver::LOG_FAILED_MARKER,
+        );
 
-        let tc_output = TestCaseOutput::new(&log_files.envout);
+        // A coprocess that failed is dropped instead of being returned to the idle ones
+        let mut coprocess = self.checkout_coprocess()?;
+        let output = match coprocess.run(&command) {
+            Ok(output) => {
+                self.return_coprocess(coprocess);
+                output
+            }
+            // The test case killed the coprocess, e.g. by sending a signal to `$$`, which fails
+            // the test case as when it was run by its own bash process
+            Err(io_err) if io_err.kind() == io::ErrorKind::UnexpectedEof => SubshellOutput {
+                status: -1,
+                stdout: Vec::new(),
+            },
+            Err(io_err) => {
+                return Err(Error::from(error::kind::TestDriverIo {
+                    filename: self.bash_path.clone(),
+                    source: io_err,
+                }));
+            }
+        };
+
+        let stdout = String::from_utf8_lossy(&output.stdout);
+        if let Some((details, _)) = stdout.split_once(BashTestDriver::LOG_FAILED_MARKER) {
+            return Err(Error::from(error::kind::TestDriverIo {
+                filename: log_files.test_case,
+                source: io::Error::other(details.trim()),
+            }));
+        }
+        let tc_output = TestCaseOutput::new(&stdout);
 
-        if output.status.success() {
+        if output.success() {
             if let Some(ref skipped_reason) = tc_output.skipped {
                 return Ok((
                     TestCaseStatus::Skipped(SkipReason::TestCaseSpecificReason(
@@ -158,32 +334,33 @@ impl TestDriver for BashTestDriver {
         test_suite_dir: &Path,
         test_suite_config: &TestSuiteConfig,
     ) -> Result<TestSuite> {
-        let mut test_files = Vec::new();
-
-        let test_suite_fixture =
-            self.get_test_suite_fixture(&test_suite_dir, &test_suite_config)?;
-
+        let local_fixture_path = test_suite_config.global_fixture.as_ref().map(PathBuf::from);
         let test_files_path = self.discover_test_files(test_suite_dir, test_suite_config);
 
-        for test_file_local_path in &test_files_path {
-            let test_file_path = test_suite_dir.join(&test_file_local_path);
-            test_files.push(TestFile {
-                setup_test_case: self
-                    .get_named_function_in_file(&test_file_path, BashTestDriver::SETUP_FN_NAME)?
-                    .map(|setup_fn| TestCase::new(&test_file_local_path, &setup_fn)),
-                teardown_test_case: self
-                    .get_named_function_in_file(&test_file_path, BashTestDriver::TEARDOWN_FN_NAME)?
-                    .map(|teardown_fn| TestCase::new(&test_file_local_path, &teardown_fn)),
-                test_cases: self
-                    .get_functions_in_file(
-                        &test_file_path,
-                        &format!("^{}", BashTestDriver::TEST_FN_PREFIX),
-                    )?
-                    .into_iter()
-                    .map(|test_fn| TestCase::new(&test_file_local_path, &test_fn))
-                    .collect(),
-            });
-        }
+        // Probe the global fixture (if any) along with the test files
+        let probed_files_path = local_fixture_path
+            .iter()
+            .chain(&test_files_path)
+            .map(|local_path| test_suite_dir.join(local_path))
+            .collect::<Vec<_>>();
+        let mut functions_per_file = self.get_functions_in_files(&probed_files_path)?.into_iter();
+
+        let test_suite_fixture = match &local_fixture_path {
+            // UNWRAP: The fixture is the first of the probed files
+            Some(local_fixture_path) => Self::get_test_suite_fixture(
+                local_fixture_path,
+                &functions_per_file.next().unwrap(),
+            )?,
+            None => TestSuiteFixture::default(),
+        };
+
+        let test_files = test_files_path
+            .iter()
+            .zip(functions_per_file)
+            .map(|(test_file_local_path, functions)| {
+                Self::get_test_file(test_file_local_path, &functions)
+            })
+            .collect::<Result<Vec<_>>>()?;
 
         Ok(TestSuite::new(
             test_suite_dir,
@@ -217,18 +394,96 @@ impl TestDriver for BashTestDriver {
     }
 }
 
+/// A bash process kept alive to run test cases, each in its own subshell, so that the cost of
+/// starting the bash interpreter is paid once instead of once per test case
+struct BashCoprocess {
+    child: Child,
+    stdin: ChildStdin,
+    stdout: BufReader<ChildStdout>,
+}
+
+/// The result of a command run by a bash coprocess
+struct SubshellOutput {
+    status: i32,
+    stdout: Vec<u8>,
+}
+
+impl SubshellOutput {
+    fn success(&self) -> bool {
+        self.status == 0
+    }
+}
+
+impl BashCoprocess {
+    const DONE_MARKER: &str = "###BATRUN_DONE";
+
+    fn spawn(bash_path: &Path) -> io::Result<Self> {
+        let mut child = Command::new(bash_path)
+            .stdin(Stdio::piped())
+            .stdout(Stdio::piped())
+            .stderr(Stdio::null())
+            .spawn()?;
+        // UNWRAP: Both stdin and stdout are piped
+        let stdin = child.stdin.take().unwrap();
+        let stdout = BufReader::new(child.stdout.take().unwrap());
+        Ok(Self {
+            child,
+            stdin,
+            stdout,
+        })
+    }
+
+    /// Run a command in a subshell of the coprocess. The stderr of the subshell is discarded.
+    /// The command is not evaluated from a string, as `eval` would add a level to the bash trace,
+    /// so it must be well-formed: an unterminated quote would leave the coprocess waiting for the
+    /// rest of it. Any string interpolated in the command must therefore be passed to `quote()`.
+    /// Note that `$$` expands to the PID of the coprocess, shared by all the test cases it runs.
+    fn run(&mut self, command: &str) -> io::Result<SubshellOutput> {
+        writeln!(
+            self.stdin,
+            "( {command} ) < /dev/null; echo '{marker}' \"$?\"",
+            marker = Self::DONE_MARKER,
+        )?;
+
+        let mut stdout = Vec::new();
+        loop {
+            let line_start = stdout.len();
+            if self.stdout.read_until(b'\n', &mut stdout)? == 0 {
+                return Err(io::Error::new(
+                    io::ErrorKind::UnexpectedEof,
+                    "bash coprocess exited unexpectedly",
+                ));
+            }
+            let line = String::from_utf8_lossy(&stdout[line_start..]);
+            if let Some(status) = line.trim_end().strip_prefix(Self::DONE_MARKER) {
+                let status = status.trim().parse().unwrap_or(-1);
+                stdout.truncate(line_start);
+                return Ok(SubshellOutput { status, stdout });
+            }
+        }
+    }
+}
+
+/// Quote a string so that bash reads it back verbatim
+fn quote(string: &str) -> String {
+    format!("'{}'", string.replace('\'', r"'\''"))
+}
+
+impl Drop for BashCoprocess {
+    fn drop(&mut self) {
+        let _ = self.child.kill();
+        let _ = self.child.wait();
+    }
+}
+
 struct LogFiles {
     test_case: PathBuf,
-    debug: PathBuf,
-    envout: PathBuf,
 }
 
 impl LogFiles {
     pub fn new(test_case_out_dir: &Path, test_case_name: &str) -> Self {
         Self {
             test_case: test_case_out_dir.join(format!("{}.test.log", test_case_name)),
-            debug: test_case_out_dir.join(format!("{}.debug.log", test_case_name)),
-            envout: test_case_out_dir.join(format!("{}.envout.log", test_case_name)),
         }
     }
 }
@@ -263,21 +518,22 @@ impl RunFnCommandBuilder {
     }
 
     fn source_fixture(mut self, fixture: &Path) -> RunFnCommandBuilder {
-        self.bash_command += &format!(
-            "echo Sourcing global fixture '{0}'; source '{0}'; ",
-            fixture.display()
-        );
+        // UNWRAP: Writing into a String cannot fail
+        write!(
+            self.bash_command,
+            "echo Sourcing global fixture {0}; source {0}; ",
+            quote(&fixture.to_string_lossy())
+        )
+        .unwrap();
         self
     }
 
     fn source_fixture_if_necessary(
         self,
-        fixture: Option<String>,
+        fixture: Option<PathBuf>,
         file_path: &Path,
-        test_suite_dir: &Path,
     ) -> RunFnCommandBuilder {
-        if let Some(fixture) = &fixture {
-            let fixture = test_suite_dir.join(fixture);
+        if let Some(fixture) = fixture {
             // Do not source the fixture if we are executing a function from the fixture
             if fixture != file_path {
                 return self.source_fixture(&fixture);
@@ -287,18 +543,26 @@ impl RunFnCommandBuilder {
     }
 
     fn source_test_file(mut self, file_path: &Path) -> RunFnCommandBuilder {
-        self.bash_command += &format!(
-            "echo Sourcing test file '{0}'; source '{0}'; ",
-            file_path.display()
-        );
+        // UNWRAP: Writing into a String cannot fail
+        write!(
+            self.bash_command,
+            "echo Sourcing test file {0}; source {0}; ",
+            quote(&file_path.to_string_lossy())
+        )
+        .unwrap();
         self
     }
 
     fn execute_fn(mut self, fn_name: &str, target: &str, out_dir: &Path) -> RunFnCommandBuilder {
-        self.bash_command += &format!(
-            "\"{fn_name}\" \"{target}\" \"{out_dir}\";",
-            out_dir = out_dir.display()
-        );
+        // UNWRAP: Writing into a String cannot fail
+        write!(
+            self.bash_command,
+            "{fn_name} {target} {out_dir};",
+            fn_name = quote(fn_name),
+            target = quote(target),
+            out_dir = quote(&out_dir.to_string_lossy())
+        )
+        .unwrap();
         self
     }
 
@@ -315,10 +579,9 @@ struct TestCaseOutput {
 impl TestCaseOutput {
     const KNOWN_OUTPUT_ENV_VARS: &'static [&'static str] = &["BATRUN_SKIPPED"];
 
-    fn parse_output_env_vars(envout_file: &Path) -> (HashMap<String, String>, Vec<String>) {
+    fn parse_output_env_vars(envout: &str) -> (HashMap<String, String>, Vec<String>) {
         let mut unknown_env_vars = Vec::new();
-        let env_vars = std::fs::read_to_string(envout_file)
-            .unwrap_or(String::new())
+        let env_vars = envout
             .lines()
             .filter_map(|line| {
                 if let Some((envvar, value)) = line.split_once('=') {
@@ -340,11 +603,241 @@ impl TestCaseOutput {
         (env_vars, unknown_env_vars)
     }
 
-    fn new(envout_file: &Path) -> Self {
-        let (env_vars, unknown_env_vars) = Self::parse_output_env_vars(&envout_file);
+    fn new(envout: &str) -> Self {
+        let (env_vars, unknown_env_vars) = Self::parse_output_env_vars(envout);
         Self {
             unknown_env_vars,
             skipped: env_vars.get("BATRUN_SKIPPED").cloned(),
         }
     }
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    fn functions(names: &[&str]) -> Vec<String> {
+        names.iter().map(|name| name.to_string()).collect()
+    }
+
+    #[test]
+    fn test_find_named_function() {
+        let functions = functions(&["setup", "setup_helper", "test_01"]);
+        assert_eq!(
+            BashTestDriver::find_named_function(&functions, "setup").unwrap(),
+            Some("setup".to_string())
+        );
+        assert_eq!(
+            BashTestDriver::find_named_function(&functions, "teardown").unwrap(),
+            None
+        );
+    }
+
+    #[test]
+    fn test_find_named_function_duplicated() {
+        let functions = functions(&["setup", "setup"]);
+        assert!(matches!(
+            BashTestDriver::find_named_function(&functions, "setup"),
+            Err(Error::DuplicatedTestFn(_))
+        ));
+    }
+
+    #[test]
+    fn test_find_test_functions() {
+        let functions = functions(&["helper", "setup", "test_01", "test_02", "teardown"]);
+        assert_eq!(
+            BashTestDriver::find_test_functions(&functions).collect::<Vec<_>>(),
+            ["test_01", "test_02"]
+        );
+    }
+
+    fn test_suite_config() -> TestSuiteConfig {
+        serde_json::from_str(
+            r#"{"name": "batrun", "description": "", "version": "0.1", "driver": "bash", "targets": []}"#,
+        )
+        .unwrap()
+    }
+
+    fn paths(names: &[&str]) -> Vec<PathBuf> {
+        names.iter().map(PathBuf::from).collect()
+    }
+
+    #[test]
+    fn test_parse_list_functions_output() {
+        let functions_per_file = BashTestDriver::parse_list_functions_output(
+            &paths(&["a.sh", "b.sh", "c.sh"]),
+            "setup\ntest_01\n###BATRUN_END 0\n###BATRUN_END 1\ntest_02\n###BATRUN_END 0\n",
+            "\n###BATRUN_END\n\n###BATRUN_END\nwarning\n\n###BATRUN_END\n",
+        )
+        .unwrap();
+        // A file defining no function makes compgen fail, but it is not an error
+        assert_eq!(
+            functions_per_file,
+            [
+                functions(&["setup", "test_01"]),
+                vec![],
+                functions(&["test_02"])
+            ]
+        );
+    }
+
+    #[test]
+    fn test_parse_list_functions_output_failed_file() {
+        // The stderr of the first file does not end with a newline
+        let result = BashTestDriver::parse_list_functions_output(
+            &paths(&["a.sh", "b.sh", "c.sh"]),
+            "test_a\n###BATRUN_END 0\n###BATRUN_END 3\ntest_c\n###BATRUN_END 0\n",
+            "warn\n###BATRUN_END\nbroken\n\n###BATRUN_END\n\n###BATRUN_END\n",
+        );
+        match result {
+            Err(Error::TestFileExec(error)) => {
+                assert_eq!(error.filename, Path::new("b.sh"));
+                assert_eq!(error.details, "broken\n");
+            }
+            _ => panic!("b.sh should be reported as failed"),
+        }
+    }
+
+    #[test]
+    fn test_probe_functions_in_chunks() {
+        // A file failing to be sourced is reported wherever the chunk boundaries fall
+        let test_suite_dir =
+            std::env::temp_dir().join(format!("batrun-probe-{}", std::process::id()));
+        std::fs::create_dir_all(&test_suite_dir).unwrap();
+        let files = [
+            ("a.sh", "printf warn >&2\ntest_a() { :; }\n"),
+            ("b.sh", "echo broken >&2\nreturn 3\n"),
+            ("c.sh", "test_c() { :; }\n"),
+        ];
+        let file_paths = files
+            .iter()
+            .map(|(name, content)| {
+                let file_path = test_suite_dir.join(name);
+                std::fs::write(&file_path, content).unwrap();
+                file_path
+            })
+            .collect::<Vec<_>>();
+
+        let driver = BashTestDriver::new();
+        let results = (1..=file_paths.len())
+            .map(|chunk_size| driver.probe_functions_in_chunks(&file_paths, chunk_size))
+            .collect::<Vec<_>>();
+        std::fs::remove_dir_all(&test_suite_dir).unwrap();
+
+        for result in results {
+            match result {
+                Err(Error::TestFileExec(error)) => assert_eq!(error.filename, file_paths[1]),
+                _ => panic!("b.sh should be reported as failed"),
+            }
+        }
+    }
+
+    #[test]
+    fn test_run_test_function_exit_trap() {
+        // The output of an EXIT trap is not mistaken for output env vars
+        let test_suite_dir =
+            std::env::temp_dir().join(format!("batrun-trap-{}", std::process::id()));
+        std::fs::create_dir_all(&test_suite_dir).unwrap();
+        let file_path = test_suite_dir.join("trap.sh");
+        std::fs::write(
+            &file_path,
+            "test_trap() { trap 'echo BATRUN_SKIPPED=trap; echo FOO=bar' EXIT; }\n",
+        )
+        .unwrap();
+        let config = test_suite_config();
+
+        let driver = BashTestDriver::new();
+        let result = driver.run_test_function_from_file(
+            &test_suite_dir,
+            &config,
+            &file_path,
+            "test_trap",
+            "foo",
+            &test_suite_dir,
+            LogFiles::new(&test_suite_dir, "test_trap"),
+        );
+        let test_log = std::fs::read_to_string(test_suite_dir.join("test_trap.test.log"));
+        std::fs::remove_dir_all(&test_suite_dir).unwrap();
+
+        let (status, output) = result.unwrap();
+        assert!(matches!(status, TestCaseStatus::Passed));
+        assert!(output.unknown_env_vars.is_empty());
+        assert!(output.skipped.is_none());
+        assert!(test_log.unwrap().ends_with("FOO=bar\n"));
+    }
+
+    #[test]
+    fn test_run_test_function_kill_coprocess() {
+        let test_suite_dir =
+            std::env::temp_dir().join(format!("batrun-kill-{}", std::process::id()));
+        std::fs::create_dir_all(&test_suite_dir).unwrap();
+        let file_path = test_suite_dir.join("kill.sh");
+        std::fs::write(&file_path, "test_kill() { kill -9 $$; }\n").unwrap();
+        let config = test_suite_config();
+
+        let driver = BashTestDriver::new();
+        let result = driver.run_test_function_from_file(
+            &test_suite_dir,
+            &config,
+            &file_path,
+            "test_kill",
+            "foo",
+            &test_suite_dir,
+            LogFiles::new(&test_suite_dir, "test_kill"),
+        );
+        std::fs::remove_dir_all(&test_suite_dir).unwrap();
+
+        let (status, _) = result.unwrap();
+        assert!(matches!(status, TestCaseStatus::Failed));
+    }
+
+    #[test]
+    fn test_run_test_function_log_failed() {
+        let config = test_suite_config();
+        let out_dir = Path::new("/nonexistent");
+
+        let driver = BashTestDriver::new();
+        let result = driver.run_test_function_from_file(
+            out_dir,
+            &config,
+            &out_dir.join("test.sh"),
+            "test_01",
+            "foo",
+            out_dir,
+            LogFiles::new(out_dir, "test_01"),
+        );
+        match result {
+            Err(Error::TestDriverIo(error)) => {
+                assert_eq!(error.filename, out_dir.join("test_01.test.log"))
+            }
+            _ => panic!("the test case log should be reported as not writable"),
+        }
+    }
+
+    #[test]
+    fn test_quote() {
+        assert_eq!(quote("it's"), r"'it'\''s'");
+    }
+
+    #[test]
+    fn test_coprocess_run() {
+        let mut coprocess = BashCoprocess::spawn(Path::new("bash")).unwrap();
+        let output = coprocess.run("echo \"it's\"; exit 3").unwrap();
+        assert_eq!(output.status, 3);
+        assert_eq!(output.stdout, b"it's\n");
+        // The coprocess survives the exit of the subshell and can be reused
+        let output = coprocess.run(&format!("echo {}", quote("'\""))).unwrap();
+        assert_eq!(output.stdout, b"'\"\n");
+        assert!(!coprocess.run("false").unwrap().success());
+        assert!(coprocess.run("true").unwrap().success());
+    }
+
+    #[test]
+    fn test_coprocess_run_trace() {
+        // The subshell adds no level to the trace, as for a command run with `bash -c`
+        let mut coprocess = BashCoprocess::spawn(Path::new("bash")).unwrap();
+        let output = coprocess.run("exec 2>&1; set -x; true").unwrap();
+        let trace = String::from_utf8_lossy(&output.stdout);
+        assert_eq!(trace, "+ true\n");
+    }
+}
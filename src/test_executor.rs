@@ -12,6 +12,7 @@ use crate::time::TimeInterval;
 
 use std::collections::HashMap;
 use std::path::{Path, PathBuf};
+use std::sync::Arc;
 
 pub trait Executor<'tr> {
     fn execute(
@@ -25,7 +26,8 @@ pub trait Executor<'tr> {
 
 pub struct TestCaseExecInfo {
     result: Result<RunTestOutput>,
-    duration: TimeInterval,
+    /// Started when the test case starts running, None if it has not run yet
+    duration: Option<TimeInterval>,
     out_dir: PathBuf,
 }
 impl TestCaseExecInfo {
@@ -35,7 +37,7 @@ impl TestCaseExecInfo {
                 test_case_status: TestCaseStatus::NotRun,
                 driver_output: None,
             }),
-            duration: TimeInterval::new(),
+            duration: None,
             out_dir,
         }
     }
@@ -52,11 +54,13 @@ impl TestCaseExecInfo {
                 driver_output: _,
             }) => {
                 self.result = result;
-                self.duration = TimeInterval::new();
+                self.duration = Some(TimeInterval::new());
             }
             _ => {
                 self.result = result;
-                self.duration.stop();
+                if let Some(duration) = &mut self.duration {
+                    duration.stop();
+                }
             }
         }
     }
@@ -68,19 +72,39 @@ impl TestCaseExecInfo {
 pub struct ExecutionContext {
     target: String,
     exec_info: HashMap<TestCase, TestCaseExecInfo>,
+    /// Updated each time a test case completes, so that reporters get it without scanning all the
+    /// test cases
+    statistics: Statistics,
+    /// Go through all the test cases without running them nor creating their output directory
+    dry_run: bool,
 }
 
 impl<'tr> ExecutionContext {
-    pub fn new(test_suite: &'tr TestSuite, target: String, out_dir: &Path) -> Self {
+    pub fn new(test_suite: &'tr TestSuite, target: String, out_dir: &Path, dry_run: bool) -> Self {
         let mut exec_info = HashMap::<TestCase, TestCaseExecInfo>::new();
+        // All the test cases of a file share the same output directory, prepare it only once
+        let mut test_file_out_dirs = HashMap::<Arc<Path>, PathBuf>::new();
         Visitor::new(&test_suite).visit_all_ok(|tc, _| {
-            let out_dir_result = Self::prepare_test_case_out_dir(out_dir, &target, tc);
-            match out_dir_result {
-                Ok(out_dir) => exec_info.insert(tc.clone(), TestCaseExecInfo::new(out_dir)),
-                Err(err) => panic!("{:?}", err),
+            let test_case_out_dir = match test_file_out_dirs.get(tc.path()) {
+                Some(test_file_out_dir) => test_file_out_dir.clone(),
+                None if dry_run => Self::test_case_out_dir(out_dir, &target, tc),
+                None => match Self::prepare_test_case_out_dir(out_dir, &target, tc) {
+                    Ok(test_file_out_dir) => {
+                        test_file_out_dirs
+                            .insert(tc.shared_path().clone(), test_file_out_dir.clone());
+                        test_file_out_dir
+                    }
+                    Err(err) => panic!("{:?}", err),
+                },
             };
+            exec_info.insert(tc.clone(), TestCaseExecInfo::new(test_case_out_dir));
         });
-        Self { target, exec_info }
+        Self {
+            target,
+            exec_info,
+            statistics: Statistics::default(),
+            dry_run,
+        }
     }
 
     pub fn target(&self) -> &str {
@@ -91,14 +115,19 @@ impl<'tr> ExecutionContext {
         &self.exec_info
     }
 
+    fn test_case_out_dir(global_out_dir: &Path, target: &str, test_case: &TestCase) -> PathBuf {
+        let mut test_case_out_dir = global_out_dir.to_path_buf();
+        test_case_out_dir.push(target);
+        test_case_out_dir.push(test_case.path());
+        test_case_out_dir
+    }
+
     pub fn prepare_test_case_out_dir(
         global_out_dir: &Path,
         target: &str,
         test_case: &TestCase,
     ) -> Result<PathBuf> {
-        let mut test_case_out_dir = global_out_dir.to_path_buf();
-        test_case_out_dir.push(target);
-        test_case_out_dir.push(test_case.path());
+        let test_case_out_dir = Self::test_case_out_dir(global_out_dir, target, test_case);
 
         if !test_case_out_dir.exists() {
             std::fs::create_dir_all(&test_case_out_dir).map_err(|io_err| {
@@ -136,6 +165,11 @@ impl<'tr> ExecutionContext {
                     test_case_status: TestCaseStatus::Skipped(reason),
                     driver_output: None, // TODO
                 })
+            } else if self.dry_run {
+                Ok(RunTestOutput {
+                    test_case_status: TestCaseStatus::DryRun,
+                    driver_output: None,
+                })
             } else {
                 test_driver.run_test(
                     test_suite_dir,
@@ -148,6 +182,7 @@ impl<'tr> ExecutionContext {
         };
 
         tc_exec_info.set_result(result);
+        Self::record_statistics(&mut self.statistics, &tc_exec_info.result);
         reporter.report_test_case_execution_result(&test_case, &self.target, &tc_exec_info);
 
         match tc_exec_info
@@ -161,22 +196,16 @@ impl<'tr> ExecutionContext {
     }
 
     pub fn get_statistics(&self) -> Statistics {
-        let mut stats = Statistics::default();
-
-        for exec_info in self.exec_info.values() {
-            match exec_info
-                .result
-                .as_ref()
-                .map(|output| &output.test_case_status)
-            {
-                Ok(TestCaseStatus::Passed) => stats.passed += 1,
-                Ok(TestCaseStatus::Failed) => stats.failed += 1,
-                Ok(TestCaseStatus::Skipped(_) | TestCaseStatus::DryRun) => stats.skipped += 1,
-                Err(_) => stats.runner_failed += 1,
-                _ => {}
-            }
-        }
+        self.statistics.clone()
+    }
 
-        stats
+    fn record_statistics(statistics: &mut Statistics, result: &Result<RunTestOutput>) {
+        match result.as_ref().map(|output| &output.test_case_status) {
+            Ok(TestCaseStatus::Passed) => statistics.passed += 1,
+            Ok(TestCaseStatus::Failed) => statistics.failed += 1,
+            Ok(TestCaseStatus::Skipped(_) | TestCaseStatus::DryRun) => statistics.skipped += 1,
+            Err(_) => statistics.runner_failed += 1,
+            _ => {}
+        }
     }
 }
@@ -2,17 +2,57 @@ use crate::reporter::Reporter;
 use crate::test_driver::TestDriver;
 use crate::test_executor::{ExecutionContext, Executor};
 use crate::test_suite::TestSuite;
+use crate::test_suite::visitor::Visitor;
+
+use std::num::NonZeroUsize;
+use std::sync::Mutex;
 
 pub(crate) struct ParallelExecutor;
 
+impl ParallelExecutor {
+    /// Maximum number of execution contexts running at the same time
+    fn max_workers(exec_contexts_count: usize) -> usize {
+        std::thread::available_parallelism()
+            .map_or(1, NonZeroUsize::get)
+            .min(exec_contexts_count)
+    }
+}
+
 impl<'tr> Executor<'tr> for ParallelExecutor {
     fn execute(
         &self,
-        _reporter: &'tr Box<dyn Reporter>,
-        _test_driver: &'tr Box<(dyn TestDriver + 'static)>,
-        _test_suite: &'tr TestSuite,
-        _exec_contexts: &mut [ExecutionContext],
+        reporter: &'tr Box<dyn Reporter>,
+        test_driver: &'tr Box<(dyn TestDriver + 'static)>,
+        test_suite: &'tr TestSuite,
+        exec_contexts: &'tr mut [ExecutionContext],
     ) {
-        todo!()
+        let max_workers = Self::max_workers(exec_contexts.len());
+        let pending_contexts = Mutex::new(exec_contexts.iter_mut());
+
+        // Each worker picks the next pending target and runs its test cases sequentially, so the
+        // setup/teardown ordering within a target is preserved while the number of concurrent
+        // test processes stays bounded by the available parallelism
+        std::thread::scope(|scope| {
+            for _ in 0..max_workers {
+                scope.spawn(|| {
+                    loop {
+                        // UNWRAP: The lock is never held while running a test case, so it cannot
+                        // be poisoned by a panicking test driver or reporter
+                        let Some(exec_context) = pending_contexts.lock().unwrap().next() else {
+                            break;
+                        };
+                        Visitor::new(&test_suite).visit_all(|test_case, should_skip| {
+                            exec_context.run(
+                                reporter,
+                                test_driver,
+                                test_suite,
+                                test_case,
+                                should_skip,
+                            )
+                        });
+                    }
+                });
+            }
+        });
     }
 }
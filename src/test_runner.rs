@@ -1,9 +1,10 @@
-use crate::error::{self, Result};
+use crate::error::{self, Error, Result};
 use crate::execution_strategy::ExecutionStrategy;
 use crate::reporter::Reporter;
 use crate::reporter::human_friendly::HumanFriendlyReporter;
 use crate::settings::Settings;
 use crate::test_driver::{TestDriver, TestDriverRegistry};
+use crate::test_executor::parallel::ParallelExecutor;
 use crate::test_executor::round_robin::RoundRobinExecutor;
 use crate::test_executor::sequential::SequentialExecutor;
 use crate::test_executor::{ExecutionContext, Executor};
@@ -11,12 +12,14 @@ use crate::test_suite::TestSuite;
 use crate::test_suite::config::TestSuiteConfig;
 use crate::test_suite::registry::TestSuiteRegistry;
 
+use std::collections::HashMap;
 use std::fs;
-use std::path::Path;
+use std::path::{Path, PathBuf};
 
 pub struct TestRunner {
     settings: Settings,
     test_drivers: TestDriverRegistry,
+    test_suite_configs: HashMap<PathBuf, TestSuiteConfig>,
     test_suites: TestSuiteRegistry,
     console_reporter: Box<dyn Reporter>,
 }
@@ -28,22 +31,33 @@ impl TestRunner {
         let mut test_runner = Self {
             settings,
             test_drivers: TestDriverRegistry::new(),
+            test_suite_configs: HashMap::new(),
             test_suites: TestSuiteRegistry::new(),
             console_reporter: Box::new(HumanFriendlyReporter::new(debug_enabled, matrix_summary)),
         };
-        test_runner.load_test_suites()?;
+        test_runner.for_each_test_suite_dir(Self::load_test_suite_config)?;
         Ok(test_runner)
     }
 
-    pub fn list_tests(&self, test_suite_dir: &Path) -> Result<()> {
+    /// Discover the test cases of all the test suites, reporting all the errors at once
+    /// Only the test suite configs are loaded by `new()`, as discovering the test cases is costly
+    /// and useless when only listing the targets. Otherwise the test cases of a test suite are
+    /// discovered when they are first listed or run.
+    pub fn discover_tests(&mut self) -> Result<()> {
+        self.for_each_test_suite_dir(Self::discover_test_suite)
+    }
+
+    pub fn list_tests(&mut self, test_suite_dir: &Path) -> Result<()> {
+        self.ensure_test_suite_discovered(test_suite_dir)?;
         let test_suite = self.test_suites.get(test_suite_dir)?;
         self.console_reporter.report_test_list(test_suite);
         Ok(())
     }
 
     pub fn list_targets(&self, test_suite_dir: &Path) -> Result<()> {
-        let test_suite = self.test_suites.get(test_suite_dir)?;
-        self.console_reporter.report_target_list(test_suite);
+        let config = self.test_suite_config(test_suite_dir)?;
+        self.console_reporter
+            .report_target_list(test_suite_dir, config);
         Ok(())
     }
 
@@ -54,17 +68,21 @@ impl TestRunner {
             test_suite_dir.display()
         ));
 
+        self.ensure_test_suite_discovered(test_suite_dir)?;
         let test_suite = self.test_suites.get(test_suite_dir)?;
         let test_driver = self.test_drivers.get(&test_suite.config().driver)?;
 
         let out_dir = self.settings.out_dir.join(&test_suite.config().name);
 
-        self.prepare_out_dir(&out_dir)?;
+        let dry_run = self.settings.dry_run;
+        if !dry_run {
+            self.prepare_out_dir(&out_dir)?;
+        }
         let mut exec_contexts = self
             .settings
             .targets
             .iter()
-            .map(|target| ExecutionContext::new(&test_suite, target.clone(), &out_dir))
+            .map(|target| ExecutionContext::new(&test_suite, target.clone(), &out_dir, dry_run))
             .collect::<Vec<_>>();
 
         Self::run_executor(
@@ -91,7 +109,7 @@ impl TestRunner {
         let executor: Box<dyn Executor> = match exec_strategy {
             ExecutionStrategy::RoundRobin => Box::new(RoundRobinExecutor {}),
             ExecutionStrategy::Sequential => Box::new(SequentialExecutor {}),
-            _ => todo!("{:X?}", exec_strategy),
+            ExecutionStrategy::Parallel => Box::new(ParallelExecutor {}),
         };
         executor.execute(reporter, test_driver, test_suite, exec_contexts);
     }
@@ -100,10 +118,14 @@ impl TestRunner {
         &self.settings
     }
 
-    fn load_test_suites(&mut self) -> Result<()> {
+    /// Call `f` for each test suite dir, reporting all the errors before returning the last one
+    fn for_each_test_suite_dir(
+        &mut self,
+        mut f: impl FnMut(&mut Self, &Path) -> Result<()>,
+    ) -> Result<()> {
         let mut last_error = None;
         for test_suite_dir in self.settings.test_suite_dirs.clone() {
-            if let Err(error) = self.load_test_suite(&test_suite_dir) {
+            if let Err(error) = f(self, &test_suite_dir) {
                 self.console_reporter.error_from(&error);
                 last_error = Some(error);
             }
@@ -115,14 +137,40 @@ impl TestRunner {
         }
     }
 
-    fn load_test_suite(&mut self, test_suite_dir: &Path) -> Result<()> {
+    fn load_test_suite_config(&mut self, test_suite_dir: &Path) -> Result<()> {
+        // A test suite provided several times is parsed and discovered only once
+        if self.test_suite_configs.contains_key(test_suite_dir) {
+            return Ok(());
+        }
         let config = TestSuiteConfig::load(&test_suite_dir)?;
+        self.test_drivers.get(&config.driver)?;
+        self.test_suite_configs
+            .insert(test_suite_dir.to_path_buf(), config);
+        Ok(())
+    }
+
+    fn discover_test_suite(&mut self, test_suite_dir: &Path) -> Result<()> {
+        if self.test_suites.contains(test_suite_dir) {
+            return Ok(());
+        }
+        let config = self.test_suite_config(test_suite_dir)?;
         let test_driver = self.test_drivers.get(&config.driver)?;
-        let test_suite = test_driver.discover_tests(&test_suite_dir, &config)?;
+        let test_suite = test_driver.discover_tests(&test_suite_dir, config)?;
         self.test_suites.insert(test_suite_dir, test_suite);
         Ok(())
     }
 
+    fn ensure_test_suite_discovered(&mut self, test_suite_dir: &Path) -> Result<()> {
+        self.discover_test_suite(test_suite_dir)
+            .inspect_err(|error| self.console_reporter.error_from(error))
+    }
+
+    fn test_suite_config(&self, test_suite_dir: &Path) -> Result<&TestSuiteConfig> {
+        self.test_suite_configs
+            .get(test_suite_dir)
+            .ok_or_else(|| Error::UnknownTestSuite(test_suite_dir.to_path_buf()))
+    }
+
     fn prepare_out_dir(&self, out_dir: &Path) -> Result<()> {
         if out_dir.exists() {
             self.console_reporter.warning(&format!(
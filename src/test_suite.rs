@@ -6,6 +6,7 @@ pub mod visitor;
 use self::config::TestSuiteConfig;
 
 use std::path::{Path, PathBuf};
+use std::sync::Arc;
 
 #[derive(Debug)]
 pub struct TestSuite {
@@ -98,16 +99,18 @@ pub struct TestSuiteFixture {
     pub teardown_test_case: Option<TestCase>,
 }
 
+/// A test case is cloned for each target it runs on, so the path of its file is shared between all
+/// the test cases of that file and between all their clones
 #[derive(Debug, Clone, PartialEq, Eq, Hash)]
 pub struct TestCase {
-    path: PathBuf,
+    path: Arc<Path>,
     name: String,
 }
 
 impl TestCase {
-    pub fn new(path: &Path, name: &str) -> Self {
+    pub fn new(path: impl Into<Arc<Path>>, name: &str) -> Self {
         Self {
-            path: path.to_path_buf(),
+            path: path.into(),
             name: name.to_string(),
         }
     }
@@ -116,6 +119,11 @@ impl TestCase {
         &self.path
     }
 
+    /// Returns the path shared with the other test cases of the same file, cheap to clone
+    pub(crate) fn shared_path(&self) -> &Arc<Path> {
+        &self.path
+    }
+
     pub fn name(&self) -> &str {
         &self.name
     }
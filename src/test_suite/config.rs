@@ -4,7 +4,7 @@ use serde::Deserialize;
 
 use std::fs::File;
 use std::io::Read;
-use std::path::Path;
+use std::path::{Path, PathBuf};
 
 #[derive(Debug, Deserialize, Clone)]
 pub struct TestSuiteConfig {
@@ -20,6 +20,13 @@ pub struct TestSuiteConfig {
 }
 
 impl TestSuiteConfig {
+    /// Returns the path of the global fixture file, if any, within the given test suite directory
+    pub fn global_fixture_path(&self, test_suite_dir: &Path) -> Option<PathBuf> {
+        self.global_fixture
+            .as_ref()
+            .map(|global_fixture_file| test_suite_dir.join(global_fixture_file))
+    }
+
     pub fn load(test_suite_dir: &Path) -> Result<Self> {
         let config_path = test_suite_dir.join("test-suite.json");
         let mut file = File::open(&config_path).map_err(|io_err| error::kind::SuiteConfigIo {
@@ -25,6 +25,10 @@ impl TestSuiteRegistry {
         }
     }
 
+    pub(crate) fn contains(&self, test_suite_dir: &Path) -> bool {
+        self.test_suites.contains_key(test_suite_dir)
+    }
+
     pub(crate) fn insert(&mut self, test_suite_dir: &Path, test_suite: TestSuite) {
         self.test_suites
             .insert(test_suite_dir.to_path_buf(), test_suite);